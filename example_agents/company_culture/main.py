@@ -2,15 +2,6 @@ import os
 from dotenv import load_dotenv
 from textwrap import dedent
 from pydantic import BaseModel
-from crewai import Crew, Agent, Task
-from crewai_tools import WebsiteSearchTool, SerperDevTool
-
-from gensphere_python_sdk.genpod_crewai import GenPodCrewAI
-
-load_dotenv()
-
-web_search_tool = WebsiteSearchTool()
-seper_dev_tool = SerperDevTool()
 
 class InputSchema(BaseModel):
     company_domain: str
@@ -20,6 +11,12 @@ class OutputSchema(BaseModel):
     report: str
     		
 def main():
+    from crewai import Crew, Agent, Task
+    from crewai_tools import WebsiteSearchTool, SerperDevTool
+
+    web_search_tool = WebsiteSearchTool()
+    seper_dev_tool = SerperDevTool()
+
     # Create Agents
     researcher_agent = Agent(
         role='Research Analyst',
@@ -50,6 +47,9 @@ def main():
     return  crew
 
 if __name__ == "__main__":
+    from gensphere_python_sdk.genpod_crewai import GenPodCrewAI
+
+    load_dotenv()
     host, port = os.getenv("API_HOST"), os.getenv("API_PORT")
     
     GenPodCrewAI(
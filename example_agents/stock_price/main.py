@@ -1,16 +1,14 @@
 import os
-import autogen
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
-from gensphere_python_sdk.genpod_autogen import GenPodAutoGen
-
-load_dotenv()
-
 class InputSchema(BaseModel):
     paper_topic: str
 
 def main():
+    import autogen
+    from gensphere_python_sdk.genpod_autogen import GenPodAutoGen
+
     llm_config = {
         "timeout": 600,
         "cache_seed": 44,
@@ -46,6 +44,9 @@ def main():
     }
 
 if __name__ == "__main__":
+    from gensphere_python_sdk.genpod_autogen import GenPodAutoGen
+
+    load_dotenv()
     host, port = os.getenv("API_HOST"), os.getenv("API_PORT")
     
     GenPodAutoGen(
@@ -3,7 +3,6 @@ from enum import Enum
 from typing import Annotated, Dict, Any
 from pydantic import BaseModel
 from fastapi import Body, FastAPI, HTTPException
-from autogen.agentchat import ConversableAgent, Agent
 from autogen.agentchat.chat import ChatResult
 
 from gensphere_python_sdk.logging_config import setup_logger
@@ -34,12 +33,13 @@ class GenPodAutoGen:
         
         @self.app.post("/initiate_chat/")
         async def initiate_chat(input_data: Annotated[self.input_schema, Body()]) -> ChatResult:
-            logger.info("Received request to initiate chat with inputs: %s", input_data.model_dump())
+            inputs = input_data.model_dump()
+            logger.debug("Received request to initiate chat with inputs: %s", inputs)
             try:
 
                 result = self.agent.initiate_chat(
                     self.recipient, 
-                    message=self.message.format(**input_data.model_dump())
+                    message=self.message.format(**inputs)
                 )
                 logger.info("Chat completed with result: %s", result)
                 return result
@@ -26,10 +26,11 @@ class GenPodCrewAI:
         
         @self.app.post("/kickoff/")
         async def kickoff(input_data: Annotated[self.input_schema, Body()]) -> self.output_schema:
-            logger.info("Received request to kickoff with inputs: %s", input_data.model_dump())
+            inputs = input_data.model_dump()
+            logger.debug("Received request to kickoff with inputs: %s", inputs)
             try:
 
-                result = self.crew.kickoff(inputs = input_data.model_dump())
+                result = self.crew.kickoff(inputs = inputs)
                 logger.info("Kickoff completed with result: %s", result)
                 return result.json_dict
             except Exception as e: 